@@ -1,8 +1,6 @@
 import argparse
 import logging
 
-from ramwich import RAMwich
-
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -16,6 +14,9 @@ def main():
     parser.add_argument("--activation", required=False, help="activation file (NPY)")
     args = parser.parse_args()
 
+    # Import after argument parsing so --help doesn't pay the simulator import cost
+    from ramwich import RAMwich
+
     simulator = RAMwich(config_file=args.config, ops_file=args.ops, weights_file=args.weights)
     simulator.run(activation=args.activation)
 
@@ -1,14 +1,32 @@
-from .adc import ADCArray
-from .dac import DACArray
-from .dram_controller import DRAMController
-from .inreg import InputRegisterArray
-from .memory import DRAM, SRAM
-from .mux import MuxArray
-from .noc import Network
-from .outreg import OutputRegisterArray
-from .router import Router
-from .rram_xbar import RRAMXbarArray
-from .sna import SNAArray
-from .snh import SNHArray
-from .sram_cim_unit import SRAMCIMUnitArray
-from .vfu import VFU
+import importlib
+
+# Map each public name to the submodule that defines it so attribute access
+# only imports the block actually used (PEP 562)
+_SUBMODULES = {
+    "ADCArray": "adc",
+    "DACArray": "dac",
+    "DRAMController": "dram_controller",
+    "InputRegisterArray": "inreg",
+    "DRAM": "memory",
+    "SRAM": "memory",
+    "MuxArray": "mux",
+    "Network": "noc",
+    "OutputRegisterArray": "outreg",
+    "Router": "router",
+    "RRAMXbarArray": "rram_xbar",
+    "SNAArray": "sna",
+    "SNHArray": "snh",
+    "SRAMCIMUnitArray": "sram_cim_unit",
+    "VFU": "vfu",
+}
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{_SUBMODULES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so __getattr__ only runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,26 @@
+import msgspec
 import numpy as np
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field
 
 from ..config import ADCConfig, ADCType, MVMUConfig
 from ..stats import Stats, StatsDict
 
 
-class ADCStats(BaseModel):
-    """Statistics tracking for ADC (Analog-to-Digital Converter) components"""
+class ADCStats(msgspec.Struct):
+    """Statistics tracking for ADC (Analog-to-Digital Converter) components
+
+    Kept as a msgspec.Struct instead of a pydantic model to avoid validator
+    dispatch on the per-conversion counter updates."""
 
     # Config
-    config: ADCConfig = Field(default=ADCConfig(), description="ADC configuration")
-    size: int = Field(default=0, description="Size of the ADC array")
+    config: ADCConfig = msgspec.field(default_factory=ADCConfig)
+    size: int = 0
 
     # ADC specific metrics
-    conversions: int = Field(default=0, description="Number of A/D conversions performed")
-    overflow_times: int = Field(default=0, description="Number of overflows that happens when converting")
-    conversion_errors: float = Field(default=0.0, description="Accumulated conversion error")
-    active_cycles: int = Field(default=0, description="Number of active cycles")
+    conversions: int = 0  # Number of A/D conversions performed
+    overflow_times: int = 0  # Number of overflows that happens when converting
+    conversion_errors: float = 0.0  # Accumulated conversion error
+    active_cycles: int = 0  # Number of active cycles
 
     def reset(self):
         """Reset all statistics to zero"""
@@ -38,12 +41,86 @@ class ADCStats(BaseModel):
         return StatsDict({"ADC": stats})
 
 
+def _build_convert(shape, size, current_step, min_value, max_value, lat, stats):
+    """Build a convert function specialized to one ADC array's constants
+
+    Everything convert depends on is fixed at construction, so binding the
+    values as closure cells removes the per-call attribute loads from the
+    hottest method in the simulator. The float intermediates live in scratch
+    buffers reused across calls; only the returned int array is allocated
+    fresh, since callers may hold on to it.
+    """
+
+    buf_pos = np.empty(shape)
+    buf_neg = np.empty(shape)
+    buf_ideal = np.empty(shape)
+
+    def convert(analog_value_pos: NDArray[np.float64], analog_value_neg: NDArray[np.float64]):
+        """Simulate ADC conversion from analog to digital"""
+
+        # Validate input; shapes are fixed by the MVMU wiring, so the checks
+        # are compiled out under python -O
+        if __debug__:
+            if analog_value_pos.shape != analog_value_neg.shape:
+                raise ValueError(
+                    f"Expected input vectors of the same shape, got {analog_value_pos.shape} and {analog_value_neg.shape}"
+                )
+
+            if analog_value_pos.shape != shape:
+                raise ValueError(f"Expected input vectors of shape {shape}, got {analog_value_pos.shape}")
+
+        # Apply quantization based on resolution, writing every float
+        # intermediate into the preallocated scratch buffers
+        np.divide(analog_value_pos, current_step, out=buf_pos)
+        np.divide(analog_value_neg, current_step, out=buf_neg)
+        np.subtract(buf_pos, buf_neg, out=buf_ideal)
+        np.rint(buf_pos, out=buf_pos)
+        np.rint(buf_neg, out=buf_neg)
+        np.subtract(buf_pos, buf_neg, out=buf_pos)
+        int_values = buf_pos.astype(np.int_)
+
+        # Accumulate the quantization error in place: |ideal - rounded|
+        np.subtract(buf_ideal, buf_pos, out=buf_ideal)
+        np.abs(buf_ideal, out=buf_ideal)
+        total_error = float(buf_ideal.sum())
+
+        # Clip values to max_value; overflow happened wherever clipping changed a value,
+        # so one comparison against the clipped result replaces the two range checks
+        clipped_values = np.clip(int_values, min_value, max_value)
+        overflow_count = int(np.count_nonzero(int_values != clipped_values))
+        int_values = clipped_values
+
+        # Update stats
+        stats.conversions += size
+        stats.overflow_times += overflow_count
+        stats.conversion_errors += total_error
+        stats.active_cycles += lat
+
+        return int_values
+
+    return convert
+
+
 class ADCArray:
     """Hardware implementation of the ADC component"""
 
+    __slots__ = (
+        "mvmu_config",
+        "adc_config",
+        "lat",
+        "max_value",
+        "min_value",
+        "shape",
+        "size",
+        "current_step",
+        "stats",
+        "convert",
+    )
+
     def __init__(self, mvmu_config: MVMUConfig):
         self.mvmu_config = mvmu_config
         self.adc_config = self.mvmu_config.adc_config
+        self.lat = self.adc_config.lat
 
         # calculate max value based on resolution
         self.max_value = (1 << self.adc_config.resolution) - 1
@@ -63,7 +140,7 @@ class ADCArray:
         xbar_indices = np.where(self.mvmu_config.is_xbar_rram)[0]
 
         # Vectorized calculation of conductance steps
-        xbar_bits = np.array([self.mvmu_config.bits_per_cell[idx] for idx in xbar_indices])[:, np.newaxis]
+        xbar_bits = np.asarray(self.mvmu_config.bits_per_cell)[xbar_indices][:, np.newaxis]
 
         voltage_step = self.mvmu_config.dac_config.VDD / (2**self.mvmu_config.dac_config.resolution - 1)
         conductance_range = (
@@ -77,44 +154,10 @@ class ADCArray:
         # Initialize stats
         self.stats = ADCStats(config=self.adc_config, size=self.size)
 
-    def convert(self, analog_value_pos: NDArray[np.float64], analog_value_neg: NDArray[np.float64]):
-        """Simulate ADC conversion from analog to digital"""
-
-        # Validate input
-        if analog_value_pos.shape != analog_value_neg.shape:
-            raise ValueError(
-                f"Expected input vectors of the same shape, got {analog_value_pos.shape} and {analog_value_neg.shape}"
-            )
-
-        if analog_value_pos.shape != self.shape:
-            raise ValueError(f"Expected input vectors of shape {self.shape}, got {analog_value_pos.shape}")
-
-        # Apply quantization based on resolution
-        ideal_values_pos = analog_value_pos / self.current_step
-        ideal_values_neg = analog_value_neg / self.current_step
-        ideal_values = ideal_values_pos - ideal_values_neg
-        int_values_pos = np.round(ideal_values_pos).astype(np.int_)
-        int_values_neg = np.round(ideal_values_neg).astype(np.int_)
-        int_values = int_values_pos - int_values_neg
-        errors = np.abs(ideal_values - int_values)
-
-        # Check if overflow occurs
-        overflow_mask = (int_values > self.max_value) | (int_values < self.min_value)
-        overflow_count = np.sum(overflow_mask)
-
-        # Calculate total error
-        total_error = np.sum(errors)
-
-        # Clip values to max_value
-        int_values = np.clip(int_values, self.min_value, self.max_value)
-
-        # Update stats
-        self.stats.conversions += self.size
-        self.stats.overflow_times += overflow_count
-        self.stats.conversion_errors += total_error
-        self.stats.active_cycles += self.adc_config.lat
-
-        return int_values
+        # Bind the hot conversion path to this array's constants
+        self.convert = _build_convert(
+            self.shape, self.size, self.current_step, self.min_value, self.max_value, self.lat, self.stats
+        )
 
     def reset(self):
         """Reset all statistics to zero"""
@@ -1,21 +1,24 @@
+import msgspec
 import numpy as np
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field
 
 from ..config import DACConfig, MVMUConfig
 from ..stats import Stats, StatsDict
 
 
-class DACStats(BaseModel):
-    """Statistics tracking for DAC (Digital-to-Analog Converter) components"""
+class DACStats(msgspec.Struct):
+    """Statistics tracking for DAC (Digital-to-Analog Converter) components
+
+    Kept as a msgspec.Struct instead of a pydantic model to avoid validator
+    dispatch on the per-conversion counter updates."""
 
     # Config
-    config: DACConfig = Field(default=DACConfig(), description="DAC configuration")
-    size: int = Field(default=0, description="Size of the DAC array")
+    config: DACConfig = msgspec.field(default_factory=DACConfig)
+    size: int = 0
 
     # DAC specific metrics
-    conversions: int = Field(default=0, description="Number of D/A conversions performed")
-    active_cycles: int = Field(default=0, description="Number of active cycles")
+    conversions: int = 0  # Number of D/A conversions performed
+    active_cycles: int = 0  # Number of active cycles
 
     def reset(self):
         """Reset all statistics to zero"""
@@ -41,6 +44,8 @@ class DACArray:
         self.mvmu_config = mvmu_config
         self.dac_config = self.mvmu_config.dac_config
         self.size = self.mvmu_config.xbar_config.xbar_size
+        self.lat = self.dac_config.lat
+        self.vdd = self.dac_config.VDD
 
         # Calculate max value based on resolution
         self.max_value = (1 << self.mvmu_config.dac_config.resolution) - 1
@@ -61,11 +66,11 @@ class DACArray:
         # Apply analog conversion based on resolution
         fraction = digital_value / self.max_value
         clipped_value = np.clip(fraction, 0, 1)
-        analog_value = clipped_value * self.mvmu_config.dac_config.VDD
+        analog_value = clipped_value * self.vdd
 
         # Update stats
         self.stats.conversions += self.size
-        self.stats.active_cycles += self.dac_config.lat
+        self.stats.active_cycles += self.lat
 
         return analog_value
 
@@ -1,9 +1,10 @@
 from typing import Optional
 
+import msgspec
 import numpy as np
 import simpy
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from pydantic.config import ConfigDict
 
 from ..config import TileConfig
@@ -49,20 +50,23 @@ class WriteRequest(Request):
         return self.data.shape[0]
 
 
-class DRAMControllerStats(BaseModel):
-    """Statistics for DRAM controller operations"""
+class DRAMControllerStats(msgspec.Struct):
+    """Statistics for DRAM controller operations
+
+    Kept as a msgspec.Struct instead of a pydantic model since these counters
+    are bumped on every DRAM request."""
 
     # Universal metrics
-    config: TileConfig = Field(default=TileConfig(), description="Tile configuration")
+    config: Optional[TileConfig] = None  # Tile configuration
 
     # DRAM controller specific metrics
-    read_requests: int = Field(default=0, description="Number of read requests")
-    write_requests: int = Field(default=0, description="Number of write requests")
-    total_requests: int = Field(default=0, description="Total number of requests")
-    total_wait_time: int = Field(default=0.0, description="Total wait time for requests")
-    max_wait_time: int = Field(default=0.0, description="Maximum wait time for requests")
-    active_cycles: int = Field(default=0, description="Number of active cycles")
-    operating_time: int = Field(default=0, description="Total operating time")
+    read_requests: int = 0  # Number of read requests
+    write_requests: int = 0  # Number of write requests
+    total_requests: int = 0  # Total number of requests
+    total_wait_time: float = 0.0  # Total wait time for requests
+    max_wait_time: float = 0.0  # Maximum wait time for requests
+    active_cycles: int = 0  # Number of active cycles
+    operating_time: int = 0  # Total operating time
 
     def reset(self):
         """Reset the statistics"""
@@ -1,27 +1,30 @@
-from typing import Union
+from typing import Optional, Union
 
+import msgspec
 import numpy as np
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field
 
 from ..config import CoreConfig, MVMUConfig, TileConfig
 from ..stats import Stats, StatsDict
 
 
-class MemoryStats(BaseModel):
-    """Statistics for Memory operations"""
+class MemoryStats(msgspec.Struct):
+    """Statistics for Memory operations
+
+    Kept as a msgspec.Struct instead of a pydantic model to avoid validator
+    dispatch on the per-access counter updates."""
 
     # Universal metrics
-    config: Union[MVMUConfig, CoreConfig, TileConfig] = Field(default=None, description="Configuration object")
+    config: Optional[Union[MVMUConfig, CoreConfig, TileConfig]] = None  # Configuration object
 
     # Memory specific metrics
-    memory_type: str = Field(default="", description="Type of memory (SRAM/DRAM)")
-    read_operations: int = Field(default=0, description="Number of read operations")
-    read_cells: int = Field(default=0, description="Number of read cells")
-    write_operations: int = Field(default=0, description="Number of write operations")
-    write_cells: int = Field(default=0, description="Number of written cells")
-    total_operations: int = Field(default=0, description="Total number of operations")
-    total_operated_cells: int = Field(default=0, description="Total number of operated cells")
+    memory_type: str = ""  # Type of memory (SRAM/DRAM)
+    read_operations: int = 0  # Number of read operations
+    read_cells: int = 0  # Number of read cells
+    write_operations: int = 0  # Number of write operations
+    write_cells: int = 0  # Number of written cells
+    total_operations: int = 0  # Total number of operations
+    total_operated_cells: int = 0  # Total number of operated cells
 
     def reset(self):
         """Reset all statistics to zero"""
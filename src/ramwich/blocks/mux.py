@@ -1,6 +1,6 @@
 import numpy as np
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from ..config import MVMUConfig
 from ..stats import Stats, StatsDict
@@ -10,11 +10,11 @@ class MUXStats(BaseModel):
     """Statistics tracking for MUX components"""
 
     # config
-    config: MVMUConfig = Field(default=MVMUConfig(), description="MUX configuration")
-    size: int = Field(default=0, description="Size of the MUX array")
+    config: MVMUConfig = MVMUConfig()  # MUX configuration
+    size: int = 0  # Size of the MUX array
 
     # MUX specific metrics
-    selections: int = Field(default=0, description="Number of selections performed")
+    selections: int = 0  # Number of selections performed
 
     def reset(self):
         """Reset all statistics to zero"""
@@ -64,11 +64,16 @@ class MuxArray:
 
         reshaped_input = input_array.reshape(self.num_xbar, self.num_mux_per_xbar, self.num_input_per_mux)
 
-        # Update stats
-        self.stats.selections += self.size
-
         return reshaped_input[:, :, index]
 
+    def record_selections(self, count: int):
+        """Record `count` select calls in one batched stats update
+
+        The stats update is kept out of select so the driving loop can flush
+        its selection count once instead of per call.
+        """
+        self.stats.selections += self.size * count
+
     def reset(self):
         """Reset all statistics to zero"""
         self.stats.reset()
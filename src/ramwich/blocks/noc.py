@@ -1,19 +1,24 @@
+from typing import Optional
+
+import msgspec
 import simpy
-from pydantic import BaseModel, Field
 
 from ..config import Config, NOCConfig
 from ..stats import Stats, StatsDict
 
 
-class NetworkStats(BaseModel):
-    """Statistics for DRAM operations"""
+class NetworkStats(msgspec.Struct):
+    """Statistics for Network operations
+
+    Kept as a msgspec.Struct for consistency with the other per-block stats
+    classes."""
 
     # config
-    config: NOCConfig = Field(default=NOCConfig(), description="Configuration object")
-    ratio: float = Field(default=0.0, description="Ratio of tiles to ports")
-    leakage_energy_per_cycle: float = Field(default=0.0, description="Leakage energy consumption for 1 cycle in pJ")
-    area_inter: float = Field(default=0.0, description="Area for NOC internode in mm^2")
-    area_intra: float = Field(default=0.0, description="Area for NOC intranode in mm^2")
+    config: Optional[NOCConfig] = None  # Configuration object
+    ratio: float = 0.0  # Ratio of tiles to ports
+    leakage_energy_per_cycle: float = 0.0  # Leakage energy consumption for 1 cycle in pJ
+    area_inter: float = 0.0  # Area for NOC internode in mm^2
+    area_intra: float = 0.0  # Area for NOC intranode in mm^2
 
     def get_stats(self) -> StatsDict:
         """Convert NetworkStats to general Stats object"""
@@ -32,6 +37,8 @@ class NetworkStats(BaseModel):
 
 
 class Network:
+    __slots__ = ("config", "noc_config", "routers", "queue_busy_cycles", "is_tracking", "env", "monitor_process", "stats")
+
     def __init__(self, config: Config):
         self.config = config
         self.noc_config = self.config.noc_config
@@ -1,26 +1,31 @@
+from typing import Optional
+
+import msgspec
 import numpy as np
 import simpy
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field
 
 from ..config import Config
 from ..stats import Stats, StatsDict
 from .noc import Network
 
 
-class RouterStats(BaseModel):
-    """Statistics for DRAM operations"""
+class RouterStats(msgspec.Struct):
+    """Statistics for Router operations
+
+    Kept as a msgspec.Struct instead of a pydantic model to avoid validator
+    dispatch on the per-packet counter updates."""
 
     # Universal metrics
-    config: Config = Field(default=Config(), description="Configuration object")
+    config: Optional[Config] = None  # Configuration object
 
     # Router specific metrics
-    packets_created: int = Field(default=0, description="Number of packets created")
-    packets_sent_internode: int = Field(default=0, description="Number of packets sent to other nodes")
-    packets_sent_intranode: int = Field(default=0, description="Number of packets sent to the same node")
-    packets_sent: int = Field(default=0, description="Number of packets sent")
-    packets_received: int = Field(default=0, description="Number of packets received")
-    packets_read: int = Field(default=0, description="Number of packets read by receive operation")
+    packets_created: int = 0  # Number of packets created
+    packets_sent_internode: int = 0  # Number of packets sent to other nodes
+    packets_sent_intranode: int = 0  # Number of packets sent to the same node
+    packets_sent: int = 0  # Number of packets sent
+    packets_received: int = 0  # Number of packets received
+    packets_read: int = 0  # Number of packets read by receive operation
 
     def reset(self):
         """Reset all statistics to zero"""
@@ -71,6 +76,12 @@ class Router:
         # Register this router with the network
         self.network.register_router(self)
 
+        # Resolve the per-packet latency constants once; _get_latency runs for
+        # every packet the send thread handles
+        self.num_tiles_per_node = self.config.num_tiles_per_node
+        self.intra_lat = self.config.noc_config.noc_intra_lat
+        self.inter_lat = self.config.noc_config.noc_intra_lat + self.config.noc_config.noc_inter_lat
+
         # Initialize stats
         self.stats = RouterStats(config=self.config)
 
@@ -136,17 +147,13 @@ class Router:
     def _get_latency(self, source: int, target: int):
         """Calculate the latency between two routers"""
         # input and output tiles are considered to be on a different node with other tiles
-        if (
-            source == 0
-            or target == 1
-            or source // self.config.num_tiles_per_node == target // self.config.num_tiles_per_node
-        ):
+        if source == 0 or target == 1 or source // self.num_tiles_per_node == target // self.num_tiles_per_node:
             # Intra-node communication
             # Also return a flag indicating that this is not inter-node communication
-            return self.config.noc_config.noc_intra_lat, False
+            return self.intra_lat, False
         else:
             # Inter-node communication
-            return self.config.noc_config.noc_intra_lat + self.config.noc_config.noc_inter_lat, True
+            return self.inter_lat, True
 
     def add_send_packet(self, target: int, data: NDArray[np.int32]):
         """Send a packet to the router"""
@@ -1,18 +1,23 @@
+import msgspec
 import numpy as np
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field
 
 from ..config import MVMUConfig, XBARConfig
 from ..stats import Stats, StatsDict
 
 
-class RRAMXbarStats(BaseModel):
+class RRAMXbarStats(msgspec.Struct):
+    """Statistics tracking for RRAM crossbar arrays
+
+    Kept as a msgspec.Struct instead of a pydantic model to avoid validator
+    dispatch on the per-MVM counter updates."""
+
     # Universal metrics
-    config: XBARConfig = Field(default=XBARConfig(), description="Xbar configuration")
-    num_xbar: int = Field(default=0, description="Number of crossbars")
+    config: XBARConfig = msgspec.field(default_factory=XBARConfig)
+    num_xbar: int = 0
 
     # Xbar specific metrics
-    mvm_operations: int = Field(default=0, description="Total number of operations")
+    mvm_operations: int = 0  # Total number of operations
 
     def reset(self):
         """Reset all statistics to zero"""
@@ -35,6 +40,8 @@ class RRAMXbarArray:
     Crossbar array component that performs matrix-vector multiplication operations.
     """
 
+    __slots__ = ("mvmu_config", "xbar_config", "num_xbar", "xbar_size", "has_noise", "pos_xbar", "neg_xbar", "stats")
+
     def __init__(self, mvmu_config: MVMUConfig):
         self.mvmu_config = mvmu_config
         self.xbar_config = self.mvmu_config.xbar_config
@@ -60,7 +67,7 @@ class RRAMXbarArray:
         self.neg_xbar = np.maximum(-weights, 0)
 
     def __repr__(self):
-        return f"Xbar({self.id}, size={self.size})"
+        return f"RRAMXbarArray(num_xbar={self.num_xbar}, size={self.xbar_size})"
 
     def execute_mvm(self, input_vector: NDArray[np.float64]):
         """Execute a matrix-vector multiplication operation
@@ -106,11 +113,3 @@ class RRAMXbarArray:
     def get_stats(self) -> StatsDict:
         """Get statistics for this Xbar"""
         return self.stats.get_stats()
-
-    def set_values(self, values: list[int]):
-        """Set values in the crossbar"""
-        for i, val in enumerate(values):
-            if i < self.size:
-                self.memory[i] = val
-            else:
-                break
@@ -1,6 +1,6 @@
 import numpy as np
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from ..config import MVMUConfig
 from ..stats import Stats, StatsDict
@@ -10,11 +10,11 @@ class SNAStats(BaseModel):
     """Statistics tracking for SNA (Shift and Add) components"""
 
     # Config
-    config: MVMUConfig = Field(default=MVMUConfig(), description="Configuration object")
+    config: MVMUConfig = MVMUConfig()  # Configuration object
 
     # SNA specific metrics
-    operations: int = Field(default=0, description="Number of operations performed")
-    active_cycles: int = Field(default=0, description="Number of active cycles")
+    operations: int = 0  # Number of operations performed
+    active_cycles: int = 0  # Number of active cycles
 
     def reset(self):
         """Reset all statistics to zero"""
@@ -82,11 +82,16 @@ class SNAArray:
         # shift the result to the left by bits
         result = result << bits
 
-        # Update stats
-        self.stats.operations += self.size
-
         return result + current_value
 
+    def record_operations(self, count: int):
+        """Record `count` calculate calls in one batched stats update
+
+        The stats update is kept out of calculate so the driving loop can
+        flush its operation count once instead of per call.
+        """
+        self.stats.operations += self.size * count
+
     def reset(self):
         """Reset all statistics to zero"""
         self.stats.reset()
@@ -1,5 +1,5 @@
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from ..config import MVMUConfig
 from ..stats import Stats, StatsDict
@@ -9,11 +9,11 @@ class SNHStats(BaseModel):
     """Statistics tracking for Sample-and-Hold (SNH) components"""
 
     # Universal metrics
-    config: MVMUConfig = Field(default=MVMUConfig(), description="SNH configuration")
-    size: int = Field(default=0, description="Size of the SNH array")
+    config: MVMUConfig = MVMUConfig()  # SNH configuration
+    size: int = 0  # Size of the SNH array
 
     # SNH specific metrics
-    samples: int = Field(default=0, description="Number of samples taken")
+    samples: int = 0  # Number of samples taken
 
     def reset(self):
         """Reset all statistics to zero"""
@@ -46,10 +46,14 @@ class SNHArray:
         # Initialize stats
         self.stats = SNHStats(config=self.mvmu_config, size=self.size)
 
-    def sample(self):
-        """Sample the input data"""
+    def sample(self, count: int = 1):
+        """Sample the input data `count` times
+
+        Sampling is pure accounting, so callers in a loop can record all
+        iterations with a single call instead of one stats update each.
+        """
         # Update the stats
-        self.stats.samples += self.size
+        self.stats.samples += self.size * count
 
     def reset(self):
         """Reset the statistics"""
@@ -1,6 +1,6 @@
 import numpy as np
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from ..config import MVMUConfig, XBARConfig
 from ..stats import Stats, StatsDict
@@ -8,12 +8,12 @@ from ..stats import Stats, StatsDict
 
 class SRAMCIMUnitStats(BaseModel):
     # Universal metrics
-    config: XBARConfig = Field(default=XBARConfig(), description="Xbar configuration")
-    num_xbar: int = Field(default=0, description="Number of crossbars")
-    num_calculator_per_xbar: int = Field(default=0, description="Number of calculators")
+    config: XBARConfig = XBARConfig()  # Xbar configuration
+    num_xbar: int = 0  # Number of crossbars
+    num_calculator_per_xbar: int = 0  # Number of calculators
 
     # Xbar specific metrics
-    mac_operations: int = Field(default=0, description="Total number of operations")
+    mac_operations: int = 0  # Total number of operations
 
     def reset(self):
         """Reset all statistics to zero"""
@@ -39,6 +39,8 @@ class SRAMCIMUnitArray:
     Crossbar array component that performs matrix-vector multiplication operations.
     """
 
+    __slots__ = ("mvmu_config", "xbar_config", "num_xbar", "xbar_size", "num_calculator_per_xbar", "pos_xbar", "neg_xbar", "stats")
+
     def __init__(self, mvmu_config: MVMUConfig):
         self.mvmu_config = mvmu_config
         self.xbar_config = self.mvmu_config.xbar_config
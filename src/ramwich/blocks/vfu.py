@@ -1,26 +1,31 @@
+import warnings
 from typing import Optional, Union
 
 import numpy as np
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from ..config import Config, CoreConfig
 from ..ops import VFUOpType
 from ..stats import Stats, StatsDict
 
+# Opcode classification tables, built once instead of per-call list scans
+_UNARY_OPS = frozenset({"not", "sig", "tanh", "relu"})
+_STAT_TYPE = {"mul": "mul", "div": "div", "sig": "act", "tanh": "act"}
+
 
 class VFUStats(BaseModel):
     """Statistics for VFU operations"""
 
     # Universal metrics
-    config: CoreConfig = Field(default=CoreConfig(), description="Configuration object")
+    config: CoreConfig = CoreConfig()  # Configuration object
 
     # VFU specific metrics
-    mul_operations: int = Field(default=0, description="Number of read operations")
-    div_operations: int = Field(default=0, description="Number of write operations")
-    act_operations: int = Field(default=0, description="Number of activation operations")
-    other_operations: int = Field(default=0, description="Number of other operations")
-    total_operations: int = Field(default=0, description="Total number of operations")
+    mul_operations: int = 0  # Number of read operations
+    div_operations: int = 0  # Number of write operations
+    act_operations: int = 0  # Number of activation operations
+    other_operations: int = 0  # Number of other operations
+    total_operations: int = 0  # Total number of operations
 
     def reset(self):
         """Reset all statistics to zero"""
@@ -108,20 +113,13 @@ class VFU:
                 raise ValueError("Operands must be of the same length")
 
         # Determine operation type for statistics
-        if opcode in ["mul", "div"]:
-            operation_type = opcode
-        elif opcode in ["sig", "tanh"]:
-            operation_type = "act"
-        else:
-            operation_type = "other"
+        operation_type = _STAT_TYPE.get(opcode, "other")
 
         # Execute operation based on arity (unary or binary)
-        if opcode in ["not", "sig", "tanh", "relu"]:
+        if opcode in _UNARY_OPS:
             # Unary operations
             if b is not None:
                 # If b is provided for unary operation, ignore it but log a warning
-                import warnings
-
                 warnings.warn(f"Second operand provided for unary operation {opcode}, it will be ignored", stacklevel=2)
             result = self.op_handlers[opcode](a, None)
         else:
@@ -1,10 +1,18 @@
 import math
 import re
 from enum import Enum
-from typing import ClassVar
+from typing import ClassVar, Optional
 
+import yaml
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+# Use libyaml's C loader when available, it is several times faster than the pure-Python one
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Invariant scaling factors, precomputed once at import time
+BUFF_SCALE_8 = math.sqrt(8)  # Buffer scaling factor, aligned with PUMA
+BUFF_SCALE_4 = math.sqrt(4)  # Buffer scaling factor, aligned with PUMA
+
 
 class BitConfig(str, Enum):
     SLC = "1"
@@ -17,24 +25,25 @@ class BitConfig(str, Enum):
 class DataConfig(BaseModel):
     """Data type configuration"""
 
-    storage_config: list[BitConfig] = Field(
-        default=[BitConfig.MLC, BitConfig.MLC, BitConfig.MLC, BitConfig.MLC], description="Storage configuration"
-    )
-    weight_format: str = Field(default="Q1.7", description="Weight format")
+    storage_config: list[BitConfig] = [BitConfig.MLC, BitConfig.MLC, BitConfig.MLC, BitConfig.MLC]  # Storage configuration
+    weight_format: str = "Q1.7"  # Weight format
     weight_int_bits: int = Field(default=None, init=False, description="Weight integer bits")
     weight_frac_bits: int = Field(default=None, init=False, description="Weight fractional bits")
     weight_width: int = Field(default=None, init=False, description="Weight data bits")
 
-    activation_format: str = Field(default="Q4.4", description="Activation format")
+    activation_format: str = "Q4.4"  # Activation format
     activation_int_bits: int = Field(default=None, init=False, description="Activation integer bits")
     activation_frac_bits: int = Field(default=None, init=False, description="Activation fractional bits")
     activation_width: int = Field(default=None, init=False, description="Activation data bits")
 
-    addr_width: int = Field(default=32, description="Address width")
-    instrn_width: int = Field(default=48, description="Instruction width")
+    addr_width: int = 32  # Address width
+    instrn_width: int = 48  # Instruction width
 
     @model_validator(mode="after")
     def calculate_derived_values(self):
+        return self.compute_derived()
+
+    def compute_derived(self):
         # Calculate weight and activation bits based on the provided formats
         pattern = r"Q(\d+)\.(\d+)"
 
@@ -60,26 +69,16 @@ class DataConfig(BaseModel):
 class DACConfig(BaseModel):
     """Digital-to-Analog Converter configuration"""
 
-    # Class constants for lookup tables
-    LAT_DICT: ClassVar[dict[int, int]] = {1: 1, 2: 1, 4: 1, 8: 1, 16: 1}
-    POW_DYN_DICT: ClassVar[dict[int, float]] = {
-        1: 0.00350625,
-        2: 0.00350625,
-        4: 0.00350625,
-        8: 0.00350625,
-        16: 0.00350625,
-    }
-    POW_LEAK_DICT: ClassVar[dict[int, float]] = {
-        1: 0.000390625,
-        2: 0.000390625,
-        4: 0.000390625,
-        8: 0.000390625,
-        16: 0.000390625,
-    }
-    AREA_DICT: ClassVar[dict[int, float]] = {1: 1.67e-7, 2: 1.67e-7, 4: 1.67e-7, 8: 1.67e-7, 16: 1.67e-7}
+    # Class constants; all supported resolutions share the same values,
+    # so scalars replace the former per-resolution lookup tables
+    VALID_RESOLUTIONS: ClassVar[frozenset[int]] = frozenset({1, 2, 4, 8, 16})
+    LAT: ClassVar[int] = 1
+    POW_DYN: ClassVar[float] = 0.00350625
+    POW_LEAK: ClassVar[float] = 0.000390625
+    AREA: ClassVar[float] = 1.67e-7
 
-    resolution: int = Field(default=1, description="DAC resolution")
-    VDD: float = Field(default=1, description="Supply voltage")
+    resolution: int = 1  # DAC resolution
+    VDD: float = 1  # Supply voltage
 
     lat: float = Field(default=None, init=False, description="DAC latency")
     pow_dyn: float = Field(default=None, init=False, description="DAC dynamic power")
@@ -88,12 +87,15 @@ class DACConfig(BaseModel):
 
     def __init__(self, **data):
         super().__init__(**data)
-        # Update derived values if resolution is different from default
-        if self.resolution in self.LAT_DICT:
-            self.lat = self.LAT_DICT[self.resolution]
-            self.pow_dyn = self.POW_DYN_DICT[self.resolution]
-            self.pow_leak = self.POW_LEAK_DICT[self.resolution]
-            self.area = self.AREA_DICT[self.resolution]
+        self.compute_derived()
+
+    def compute_derived(self):
+        # Update derived values if resolution is supported
+        if self.resolution in self.VALID_RESOLUTIONS:
+            self.lat = self.LAT
+            self.pow_dyn = self.POW_DYN
+            self.pow_leak = self.POW_LEAK
+            self.area = self.AREA
 
 
 class XBARConfig(BaseModel):
@@ -121,7 +123,7 @@ class XBARConfig(BaseModel):
 
     xbar_lat: float = Field(default=None, init=False, description="Crossbar latency")
     xbar_pow: float = Field(default=None, init=False, description="Crossbar power")
-    xbar_pow_leak: float = Field(default=0, description="Crossbar leakage power")
+    xbar_pow_leak: float = 0  # Crossbar leakage power
     xbar_area: float = Field(default=None, init=False, description="Crossbar area")
 
     SRAM_XBAR_LAT_DICT: ClassVar[dict[int, int]] = {32: 1, 64: 1, 128: 1, 256: 1}
@@ -156,29 +158,27 @@ class XBARConfig(BaseModel):
     outMem_area: float = Field(default=None, init=False, description="Crossbar output memory area")
 
     # Set default values for derived fields instead of None
-    xbar_ip_lat: float = Field(default=100.0, description="XBAR input processing latency")
-    xbar_ip_pow: float = Field(default=1.37 * 2.0 - 1.04, description="XBAR input processing power")
-    xbar_op_lat: float = Field(default=20.0 * 12.8, description="XBAR output processing latency")
-    xbar_op_pow: float = Field(default=4.44 * 3.27 / 12.8, description="XBAR output processing power")
-    xbar_rd_lat: float = Field(default=328.0 * 1000 * (1 / 32.0), description="XBAR read latency")
-    xbar_wr_lat: float = Field(default=351.0 * 1000 * (1 / 32.0), description="XBAR write latency")
-    xbar_rd_pow: float = Field(
-        default=208.0 * 1000 * (1 / 32.0) / (328.0 * 1000 * (1 / 32.0)), description="XBAR read power"
-    )
-    xbar_wr_pow: float = Field(
-        default=676.0 * 1000 * (1 / 32.0) / (328.0 * 1000 * (1 / 32.0)), description="XBAR write power"
-    )
-
-    rram_conductance_min: float = Field(default=0, description="Min value of RRAM conductance")
-    rram_conductance_max: float = Field(default=1, description="Max value of RRAM conductance")
-
-    xbar_size: int = Field(default=128, description="Crossbar size")
-    noise_sigma: float = Field(default=0.01, description="RRAM read and calculate noise sigma")
-    has_noise: bool = Field(default=False, description="Whether to add noise to the crossbar")
+    xbar_ip_lat: float = 100.0  # XBAR input processing latency
+    xbar_ip_pow: float = 1.37 * 2.0 - 1.04  # XBAR input processing power
+    xbar_op_lat: float = 20.0 * 12.8  # XBAR output processing latency
+    xbar_op_pow: float = 4.44 * 3.27 / 12.8  # XBAR output processing power
+    xbar_rd_lat: float = 328.0 * 1000 * (1 / 32.0)  # XBAR read latency
+    xbar_wr_lat: float = 351.0 * 1000 * (1 / 32.0)  # XBAR write latency
+    xbar_rd_pow: float = 208.0 * 1000 * (1 / 32.0) / (328.0 * 1000 * (1 / 32.0))  # XBAR read power
+    xbar_wr_pow: float = 676.0 * 1000 * (1 / 32.0) / (328.0 * 1000 * (1 / 32.0))  # XBAR write power
+
+    rram_conductance_min: float = 0  # Min value of RRAM conductance
+    rram_conductance_max: float = 1  # Max value of RRAM conductance
+
+    xbar_size: int = 128  # Crossbar size
+    noise_sigma: float = 0.01  # RRAM read and calculate noise sigma
+    has_noise: bool = False  # Whether to add noise to the crossbar
 
     def __init__(self, **data):
         super().__init__(**data)
+        self.compute_derived()
 
+    def compute_derived(self):
         # Override xbar parameters based on xbar_size if it differs from default
         if self.xbar_size in self.XBAR_LAT_DICT:
             self.xbar_lat = self.XBAR_LAT_DICT[self.xbar_size]
@@ -220,15 +220,15 @@ class ADCType(str, Enum):
 class ADCConfig(BaseModel):
     """Analog-to-Digital Converter configuration"""
 
-    type: ADCType = Field(default=ADCType.NORMAL, description="ADC type")
+    type: ADCType = ADCType.NORMAL  # ADC type
 
     # Class constants for lookup tables - using integers as keys instead of strings
     LAT_DICT: ClassVar[dict[int, int]] = {1: 13, 2: 25, 4: 50, 8: 100, 16: 200}
     POW_DYN_DICT: ClassVar[dict[int, float]] = {1: 0.225, 2: 0.45, 4: 0.9, 8: 1.8, 16: 3.2}
     POW_LEAK_DICT: ClassVar[dict[int, float]] = {1: 0.025, 2: 0.05, 4: 0.1, 8: 0.2, 16: 0.4}
-    AREA_DICT: ClassVar[dict[int, float]] = {1: 0.0012, 2: 0.0012, 4: 0.0012, 8: 0.0012, 16: 0.0012}
+    AREA: ClassVar[float] = 0.0012  # Identical for all supported resolutions
 
-    resolution: int = Field(default=8, description="ADC resolution")
+    resolution: int = 8  # ADC resolution
 
     lat: float = Field(default=None, init=False, description="ADC latency")
     pow_dyn: float = Field(default=None, init=False, description="ADC dynamic power")
@@ -237,12 +237,15 @@ class ADCConfig(BaseModel):
 
     def __init__(self, **data):
         super().__init__(**data)
+        self.compute_derived()
+
+    def compute_derived(self):
         # Update derived values based on resolution if it's different from default
         if self.resolution in self.LAT_DICT:
             self.lat = self.LAT_DICT[self.resolution]
             self.pow_dyn = self.POW_DYN_DICT[self.resolution]
             self.pow_leak = self.POW_LEAK_DICT[self.resolution]
-            self.area = self.AREA_DICT[self.resolution]
+            self.area = self.AREA
 
 
 class NOCConfig(BaseModel):
@@ -256,15 +259,15 @@ class NOCConfig(BaseModel):
     POW_DYN_DICT: ClassVar[dict[int, float]] = {4: 16.13, 8: 51.48}
     POW_LEAK_DICT: ClassVar[dict[int, float]] = {4: 0.41, 8: 1.04}
 
-    inj_rate: float = Field(default=0.005, description="Injection rate")
-    num_port: int = Field(default=4, description="Number of ports")
+    inj_rate: float = 0.005  # Injection rate
+    num_port: int = 4  # Number of ports
 
     # Hypertransport network defaults
-    noc_ht_lat: float = Field(default=5, description="Hypertransport latency")
-    noc_inter_lat: float = Field(default=36, description="NoC inter-node latency")
-    noc_inter_pow_dyn: float = Field(default=10400, description="NoC inter-node dynamic power")
-    noc_inter_pow_leak: float = Field(default=0, description="NoC inter-node leakage power")
-    noc_inter_area: float = Field(default=22.88, description="NoC inter-node area")
+    noc_ht_lat: float = 5  # Hypertransport latency
+    noc_inter_lat: float = 36  # NoC inter-node latency
+    noc_inter_pow_dyn: float = 10400  # NoC inter-node dynamic power
+    noc_inter_pow_leak: float = 0  # NoC inter-node leakage power
+    noc_inter_area: float = 22.88  # NoC inter-node area
 
     # Intra-node network defaults
     noc_intra_lat: float = Field(default=None, init=False, description="NoC intra-node latency")
@@ -274,6 +277,9 @@ class NOCConfig(BaseModel):
 
     def __init__(self, **data):
         super().__init__(**data)
+        self.compute_derived()
+
+    def compute_derived(self):
         # Validate injection rate
         if self.inj_rate > self.INJ_RATE_MAX:
             raise ValueError("NoC injection rate too high! Reconsider NOC design or DNN mapping.")
@@ -299,9 +305,9 @@ class TileConfig(BaseModel):
     """Tile configuration"""
 
     # Tile Control unit
-    tcu_pow_dyn: float = Field(default=0.25 * 0.2, description="Tile control unit dynamic power")
-    tcu_pow_leak: float = Field(default=0, description="Tile control unit leakage power")
-    tcu_area: float = Field(default=0.00145, description="Tile control unit area")
+    tcu_pow_dyn: float = 0.25 * 0.2  # Tile control unit dynamic power
+    tcu_pow_leak: float = 0  # Tile control unit leakage power
+    tcu_area: float = 0.00145  # Tile control unit area
 
     # EDRAM lookup tables
     EDRAM_LAT_DICT: ClassVar[dict[int, int]] = {8: 50, 64: 50, 128: 50, 2048: 50, 8192: 50, 16384: 50}
@@ -330,8 +336,8 @@ class TileConfig(BaseModel):
         16384: 0.121,
     }
 
-    edram_size_in_KB: int = Field(default=8192, description="EDRAM size in KB")
-    edram_size: int = Field(default=4194304, description="EDRAM size")
+    edram_size_in_KB: int = 8192  # EDRAM size in KB
+    edram_size: int = 4194304  # EDRAM size
     edram_lat: float = Field(default=None, init=False, description="EDRAM latency")
     edram_pow_dyn: float = Field(default=None, init=False, description="EDRAM dynamic power")
     edram_pow_leak: float = Field(default=None, init=False, description="EDRAM leakage power")
@@ -387,44 +393,42 @@ class TileConfig(BaseModel):
         131072: 0.0041,
     }
 
-    instrnMem_size: int = Field(default=131072, description="Tile instruction memory size")
+    instrnMem_size: int = 131072  # Tile instruction memory size
     instrnMem_lat: float = Field(default=None, init=False, description="Tile instruction memory latency")
     instrnMem_pow_dyn: float = Field(default=None, init=False, description="Tile instruction memory dynamic power")
     instrnMem_pow_leak: float = Field(default=None, init=False, description="Tile instruction memory leakage power")
     instrnMem_area: float = Field(default=None, init=False, description="Tile instruction memory area")
 
     # EDRAM counter buffer values
-    counter_buff_lat: float = Field(default=1 * math.sqrt(8), description="Counter buffer latency")
-    counter_buff_pow_dyn: float = Field(default=0.65 / 2 * math.sqrt(8), description="Counter buffer dynamic power")
-    counter_buff_pow_leak: float = Field(default=0.33 / 2 * math.sqrt(8), description="Counter buffer leakage power")
-    counter_buff_area: float = Field(default=0.0041 * math.sqrt(8), description="Counter buffer area")
+    counter_buff_lat: float = 1 * BUFF_SCALE_8  # Counter buffer latency
+    counter_buff_pow_dyn: float = 0.65 / 2 * BUFF_SCALE_8  # Counter buffer dynamic power
+    counter_buff_pow_leak: float = 0.33 / 2 * BUFF_SCALE_8  # Counter buffer leakage power
+    counter_buff_area: float = 0.0041 * BUFF_SCALE_8  # Counter buffer area
 
     # EDRAM to MVMU bus values
-    edram_bus_size: int = Field(default=256, description="EDRAM bus size")
-    edram_bus_lat: float = Field(default=1, description="EDRAM bus latency")
-    edram_bus_pow_dyn: float = Field(
-        default=6 / 2, description="EDRAM bus dynamic power"
-    )  # bus width = 384, same as issac (over two cycles)
-    edram_bus_pow_leak: float = Field(
-        default=1 / 2, description="EDRAM bus leakage power"
-    )  # bus width = 384, same as issac
-    edram_bus_area: float = Field(default=0.090, description="EDRAM bus area")
+    edram_bus_size: int = 256  # EDRAM bus size
+    edram_bus_lat: float = 1  # EDRAM bus latency
+    edram_bus_pow_dyn: float = 6 / 2  # EDRAM bus dynamic power; bus width = 384, same as issac (over two cycles)
+    edram_bus_pow_leak: float = 1 / 2  # EDRAM bus leakage power; bus width = 384, same as issac
+    edram_bus_area: float = 0.090  # EDRAM bus area
 
     # EDRAM controller values
-    edram_ctrl_lat: float = Field(default=1, description="EDRAM controller latency")
-    edram_ctrl_pow_dyn: float = Field(default=0.475, description="EDRAM controller dynamic power")
-    edram_ctrl_pow_leak: float = Field(default=0.05, description="EDRAM controller leakage power")
-    edram_ctrl_area: float = Field(default=0.00145, description="EDRAM controller area")
+    edram_ctrl_lat: float = 1  # EDRAM controller latency
+    edram_ctrl_pow_dyn: float = 0.475  # EDRAM controller dynamic power
+    edram_ctrl_pow_leak: float = 0.05  # EDRAM controller leakage power
+    edram_ctrl_area: float = 0.00145  # EDRAM controller area
 
     # Receive buffer value dictionary
-    receive_buffer_lat: float = Field(default=1 * math.sqrt(4), description="Receive buffer latency")
-    receive_buffer_pow_dyn: float = Field(default=4.48 * math.sqrt(4), description="Receive buffer dynamic power")
-    receive_buffer_pow_leak: float = Field(default=0.09 * math.sqrt(4), description="Receive buffer leakage power")
-    receive_buffer_area: float = Field(default=0.0022 * math.sqrt(4), description="Receive buffer area")
+    receive_buffer_lat: float = 1 * BUFF_SCALE_4  # Receive buffer latency
+    receive_buffer_pow_dyn: float = 4.48 * BUFF_SCALE_4  # Receive buffer dynamic power
+    receive_buffer_pow_leak: float = 0.09 * BUFF_SCALE_4  # Receive buffer leakage power
+    receive_buffer_area: float = 0.0022 * BUFF_SCALE_4  # Receive buffer area
 
     def __init__(self, **data):
         super().__init__(**data)
+        self.compute_derived()
 
+    def compute_derived(self):
         if self.edram_size_in_KB in self.EDRAM_LAT_DICT:
             self.edram_lat = self.EDRAM_LAT_DICT[self.edram_size_in_KB]
             self.edram_pow_dyn = self.EDRAM_POW_DYN_DICT[self.edram_size_in_KB]
@@ -435,16 +439,16 @@ class TileConfig(BaseModel):
             self.instrnMem_lat = self.INSTRN_MEM_LAT_DICT[self.instrnMem_size]
             self.instrnMem_pow_dyn = self.INSTRN_MEM_POW_DYN_DICT[self.instrnMem_size]
             self.instrnMem_pow_leak = self.INSTRN_MEM_POW_LEAK_DICT[self.instrnMem_size]
-            self.instrnMem_area = self.INSTRN_MEM_AREA_DICT[self.instrnMem_size] * math.sqrt(8)  # Aligned with PUMA
+            self.instrnMem_area = self.INSTRN_MEM_AREA_DICT[self.instrnMem_size] * BUFF_SCALE_8  # Aligned with PUMA
 
 
 class CoreConfig(BaseModel):
     """Core configuration"""
 
     # Core Control unit (control unit and pipeline registers)
-    ccu_pow_dyn: float = Field(default=1.25 * 0.2, description="Core control unit dynamic power")
-    ccu_pow_leak: float = Field(default=0, description="Core control unit leakage power")
-    ccu_area: float = Field(default=0.00145 * 2.25, description="Core control unit area")
+    ccu_pow_dyn: float = 1.25 * 0.2  # Core control unit dynamic power
+    ccu_pow_leak: float = 0  # Core control unit leakage power
+    ccu_area: float = 0.00145 * 2.25  # Core control unit area
 
     # Memory lookup tables
     DATA_MEM_LAT_DICT: ClassVar[dict[int, int]] = {256: 1, 512: 1, 1024: 1, 2048: 1, 4096: 1}
@@ -458,7 +462,7 @@ class CoreConfig(BaseModel):
         4096: 0.00392,  # Aligned with PUMA
     }
 
-    dataMem_size: int = Field(default=4096, description="Data memory size")
+    dataMem_size: int = 4096  # Data memory size
     dataMem_lat: float = Field(default=None, init=False, description="Data memory latency")
     dataMem_pow_dyn: float = Field(default=None, init=False, description="Data memory dynamic power")
     dataMem_pow_leak: float = Field(default=None, init=False, description="Data memory leakage power")
@@ -514,28 +518,30 @@ class CoreConfig(BaseModel):
         131072: 0.0041,
     }
 
-    instrnMem_size: int = Field(default=131072, description="Core instruction memory size")
+    instrnMem_size: int = 131072  # Core instruction memory size
     instrnMem_lat: float = Field(default=None, init=False, description="Core instruction memory latency")
     instrnMem_pow_dyn: float = Field(default=None, init=False, description="Core instruction memory dynamic power")
     instrnMem_pow_leak: float = Field(default=None, init=False, description="Core instruction memory leakage power")
     instrnMem_area: float = Field(default=None, init=False, description="Core instruction memory area")
 
     # VFU parameters with default fields
-    alu_lat: int = Field(default=1, description="ALU latency")
-    num_alu_per_vfu: int = Field(default=12, description="Number of ALUs per VFU")
-    alu_pow_dyn: float = Field(default=2.4 * 32 / 45, description="ALU dynamic power")
-    alu_pow_div_dyn: float = Field(default=1.52 * 32 / 45, description="ALU division dynamic power")
-    alu_pow_mul_dyn: float = Field(default=0.795 * 32 / 45, description="ALU multiplication dynamic power")
-    act_pow_leak: float = Field(default=0.026, description="Activation unit leakage power")
-    act_pow_dyn: float = Field(default=0.26 - 0.026, description="Activation unit dynamic power")
-    alu_pow_others_dyn: float = Field(default=0.373 * 32 / 45, description="ALU other operations dynamic power")
-    alu_pow_leak: float = Field(default=0.27 * 32 / 45, description="ALU leakage power")
-    alu_area: float = Field(default=0.00567 * 32 / 45, description="ALU area")
-    act_area: float = Field(default=0.0003, description="Activation unit area")
+    alu_lat: int = 1  # ALU latency
+    num_alu_per_vfu: int = 12  # Number of ALUs per VFU
+    alu_pow_dyn: float = 2.4 * 32 / 45  # ALU dynamic power
+    alu_pow_div_dyn: float = 1.52 * 32 / 45  # ALU division dynamic power
+    alu_pow_mul_dyn: float = 0.795 * 32 / 45  # ALU multiplication dynamic power
+    act_pow_leak: float = 0.026  # Activation unit leakage power
+    act_pow_dyn: float = 0.26 - 0.026  # Activation unit dynamic power
+    alu_pow_others_dyn: float = 0.373 * 32 / 45  # ALU other operations dynamic power
+    alu_pow_leak: float = 0.27 * 32 / 45  # ALU leakage power
+    alu_area: float = 0.00567 * 32 / 45  # ALU area
+    act_area: float = 0.0003  # Activation unit area
 
     def __init__(self, **data):
         super().__init__(**data)
+        self.compute_derived()
 
+    def compute_derived(self):
         # Override dataMem parameters based on dataMem_size if it differs from default
         if self.dataMem_size in self.DATA_MEM_LAT_DICT:
             self.dataMem_lat = self.DATA_MEM_LAT_DICT[self.dataMem_size]
@@ -547,33 +553,31 @@ class CoreConfig(BaseModel):
             self.instrnMem_lat = self.INSTRN_MEM_LAT_DICT[self.instrnMem_size]
             self.instrnMem_pow_dyn = self.INSTRN_MEM_POW_DYN_DICT[self.instrnMem_size]
             self.instrnMem_pow_leak = self.INSTRN_MEM_POW_LEAK_DICT[self.instrnMem_size]
-            self.instrnMem_area = self.INSTRN_MEM_AREA_DICT[self.instrnMem_size] * math.sqrt(8)  # Aligned with PUMA
+            self.instrnMem_area = self.INSTRN_MEM_AREA_DICT[self.instrnMem_size] * BUFF_SCALE_8  # Aligned with PUMA
 
 
 class MVMUConfig(BaseModel):
     """Matrix-Vector Multiply Unit configuration"""
 
-    snh_lat: float = Field(default=1, description="Single sample and holder processing latency")
-    snh_pow_leak: float = Field(default=9.7 * 10 ** (-7), description="Single sample and holder leakage power")
-    snh_pow_dyn: float = Field(
-        default=9.7 * 10 ** (-6) - 9.7 * 10 ** (-7), description="Single sample and holder dynamic power"
-    )
-    snh_area: float = Field(default=0.00004 / 8 / 128, description="Single sample and holder area")
+    snh_lat: float = 1  # Single sample and holder processing latency
+    snh_pow_leak: float = 9.7 * 10 ** (-7)  # Single sample and holder leakage power
+    snh_pow_dyn: float = 9.7 * 10 ** (-6) - 9.7 * 10 ** (-7)  # Single sample and holder dynamic power
+    snh_area: float = 0.00004 / 8 / 128  # Single sample and holder area
 
-    mux_lat: float = Field(default=0, description="Single MUX processing latency")
-    mux_pow_leak: float = Field(default=0, description="Single MUX leakage power")
-    mux_pow_dyn: float = Field(default=0, description="Single MUX dynamic power")
-    mux_area: float = Field(default=0, description="Single MUX area")
+    mux_lat: float = 0  # Single MUX processing latency
+    mux_pow_leak: float = 0  # Single MUX leakage power
+    mux_pow_dyn: float = 0  # Single MUX dynamic power
+    mux_area: float = 0  # Single MUX area
 
-    sna_lat: float = Field(default=1, description="Single shift and adder processing latency")
-    sna_pow_leak: float = Field(default=0.005, description="Single shift and adder leakage power")
-    sna_pow_dyn: float = Field(default=0.05 - 0.005, description="Single shift and adder dynamic power")
-    sna_area: float = Field(default=0.00006, description="Single shift and adder area")
+    sna_lat: float = 1  # Single shift and adder processing latency
+    sna_pow_leak: float = 0.005  # Single shift and adder leakage power
+    sna_pow_dyn: float = 0.05 - 0.005  # Single shift and adder dynamic power
+    sna_area: float = 0.00006  # Single shift and adder area
 
-    num_columns_per_adc: int = Field(default=16, description="Number of columns per ADC")
+    num_columns_per_adc: int = 16  # Number of columns per ADC
     num_adc_per_xbar: int = Field(default=None, init=False, description="Number of ADCs per crossbar")
 
-    num_columns_per_calculator: int = Field(default=128, description="Number of columns per SRAM CIM calculator")
+    num_columns_per_calculator: int = 128  # Number of columns per SRAM CIM calculator
     num_calculator_per_xbar: int = Field(
         default=None, init=False, description="Number of SRAM CIM calculators per crossbar"
     )
@@ -587,8 +591,8 @@ class MVMUConfig(BaseModel):
     is_xbar_rram: list = Field(default=None, init=False, description="Is crossbar RRAM")
     rram_to_output_map: list = Field(default=None, init=False, description="RRAM xbars to output map")
     sram_to_output_map: list = Field(default=None, init=False, description="SRAM xbars to output map")
-    have_rram_xbar: bool = Field(default=False, description="Whether have RRAM crossbar or not")
-    have_sram_xbar: bool = Field(default=False, description="Whether have SRAM crossbar or not")
+    have_rram_xbar: bool = False  # Whether have RRAM crossbar or not
+    have_sram_xbar: bool = False  # Whether have SRAM crossbar or not
 
     dac_config: DACConfig = Field(default_factory=DACConfig)
     xbar_config: XBARConfig = Field(default_factory=XBARConfig)
@@ -596,7 +600,9 @@ class MVMUConfig(BaseModel):
 
     def __init__(self, **data):
         super().__init__(**data)
+        self.compute_derived()
 
+    def compute_derived(self):
         self.num_adc_per_xbar = self.xbar_config.xbar_size // self.num_columns_per_adc
 
         # Then verify it's a clean division
@@ -610,10 +616,10 @@ class MVMUConfig(BaseModel):
 class Config(BaseModel):
     model_config = ConfigDict(frozen=True)
     """Configuration for the RAMwich Simulator"""
-    num_nodes: int = Field(default=1, description="Number of nodes in the system")
-    num_tiles_per_node: int = Field(default=4, description="Number of tiles per node")
-    num_cores_per_tile: int = Field(default=8, description="Number of cores per tile")
-    num_mvmus_per_core: int = Field(default=6, description="Number of MVMUs per core")
+    num_nodes: int = 1  # Number of nodes in the system
+    num_tiles_per_node: int = 4  # Number of tiles per node
+    num_cores_per_tile: int = 8  # Number of cores per tile
+    num_mvmus_per_core: int = 6  # Number of MVMUs per core
 
     # Add configuration for components with default factories
     data_config: DataConfig = Field(default_factory=DataConfig)
@@ -624,6 +630,53 @@ class Config(BaseModel):
 
     @model_validator(mode="after")
     def validate_and_calculate(self):
+        return self.compute_derived()
+
+    @classmethod
+    def load(cls, path: str) -> "Config":
+        """Load a Config from a YAML file without running pydantic validation
+
+        The config files we load are generated/maintained by us, so per-field
+        validation is pure startup overhead; `from_trusted` skips it.
+        """
+        with open(path) as f:
+            return cls.from_trusted(yaml.load(f, Loader=YamlLoader))
+
+    @classmethod
+    def from_trusted(cls, data: Optional[dict] = None) -> "Config":
+        """Build a Config from a trusted dict via model_construct
+
+        Skips pydantic's per-field validator dispatch and fills the derived
+        values with the same compute_derived helpers used on the validated
+        path. Only use this for data that already matches the schema.
+        """
+        data = dict(data) if data else {}
+
+        # Construct the MVMU config with its nested converter/crossbar configs
+        mvmu_data = dict(data.pop("mvmu_config", None) or {})
+        nested = {}
+        for name, sub_cls in (("dac_config", DACConfig), ("xbar_config", XBARConfig), ("adc_config", ADCConfig)):
+            sub_config = sub_cls.model_construct(**(mvmu_data.pop(name, None) or {}))
+            sub_config.compute_derived()
+            nested[name] = sub_config
+        mvmu_config = MVMUConfig.model_construct(**mvmu_data, **nested)
+        mvmu_config.compute_derived()
+
+        # Construct the remaining sub-configs
+        sub_configs = {"mvmu_config": mvmu_config}
+        for name, sub_cls in (
+            ("data_config", DataConfig),
+            ("noc_config", NOCConfig),
+            ("tile_config", TileConfig),
+            ("core_config", CoreConfig),
+        ):
+            sub_config = sub_cls.model_construct(**(data.pop(name, None) or {}))
+            sub_config.compute_derived()
+            sub_configs[name] = sub_config
+
+        return cls.model_construct(**data, **sub_configs).compute_derived()
+
+    def compute_derived(self):
         self.mvmu_config.stored_bit = []
         self.mvmu_config.bits_per_cell = []
         self.mvmu_config.is_xbar_rram = []
@@ -10,7 +10,7 @@ from .mvmu import MVMU
 from .ops import CoreOp
 from .pipeline import Pipeline, StageConfig
 from .stats import Stats, StatsDict
-from .visitor import CoreDecodeVisitor, CoreExecutionVisitor, CoreFetchVisitor
+from .visitor import CoreExecutionVisitor
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +43,16 @@ class Core:
         # Initialize MVMUs
         self.mvmus = [MVMU(id=i, config=self.config) for i in range(self.config.num_mvmus_per_core)]
 
+        # Build the pipeline stage configuration once; fetch and decode take
+        # the same time for every op, so their latencies are resolved here
+        # instead of dispatched per op. Reruns reuse the same visitor and its
+        # dispatch tables.
+        self.pipeline_config = [
+            StageConfig("fetch", latency=self.core_config.instrnMem_lat),
+            StageConfig("decode", latency=self.core_config.dataMem_lat),
+            StageConfig("execute", CoreExecutionVisitor(self)),
+        ]
+
         # Initialize simulation timing attributes
         self.start_time = 0
         self.active_cycles = 0
@@ -124,6 +134,15 @@ class Core:
             internal_start = start % self.config.mvmu_config.xbar_config.xbar_size
             return self.mvmus[mvmu_id].read_from_outreg(internal_start, length)
 
+    def validate_operations(self):
+        """Validate the op stream once so the hot path can index MVMUs directly"""
+        num_mvmus = len(self.mvmus)
+        for op in self.operations:
+            if op.type == "mvm":
+                for mvmu_id in op.xbar:
+                    if mvmu_id < 0 or mvmu_id >= num_mvmus:
+                        raise IndexError(f"MVMU ID {mvmu_id} out of range")
+
     def run(self, env):
         """
         Execute all operations assigned to this core using a pipeline.
@@ -132,18 +151,15 @@ class Core:
         # Save the environment
         self.env = env
 
-        logger.info(f"Tile {self.parent.id} Core {self.id} starting execution at time {env.now}")
+        # Check the op stream up front instead of bounds-checking per op
+        self.validate_operations()
 
-        self.start_time = env.now
+        logger.info("Tile %s Core %s starting execution at time %s", self.parent.id, self.id, env.now)
 
-        # Create pipeline stages
-        pipeline_config = [
-            StageConfig("fetch", CoreFetchVisitor(self)),
-            StageConfig("decode", CoreDecodeVisitor(self)),
-            StageConfig("execute", CoreExecutionVisitor(self)),
-        ]
+        self.start_time = env.now
 
-        pipeline = Pipeline(env, pipeline_config)
+        # Create the pipeline for this run from the prebuilt stage configuration
+        pipeline = Pipeline(env, self.pipeline_config)
         pipeline.run()
 
         # Feed instructions into pipeline
@@ -154,7 +170,7 @@ class Core:
 
         self.active_cycles = env.now - self.start_time
 
-        logger.info(f"Tile {self.parent.id} Core {self.id} finished execution at time {env.now}")
+        logger.info("Tile %s Core %s finished execution at time %s", self.parent.id, self.id, env.now)
 
     def reset(self):
         """Reset the core and its components"""
@@ -22,6 +22,32 @@ class MVMU:
     Matrix-Vector Multiply unit with multiple crossbar arrays with detailed hardware simulation.
     """
 
+    __slots__ = (
+        "id",
+        "config",
+        "data_config",
+        "mvmu_config",
+        "input_register_array",
+        "output_register_array",
+        "sna_array",
+        "dac_array",
+        "rram_xbar_array",
+        "snh_array_pos",
+        "snh_array_neg",
+        "mux_array_pos",
+        "mux_array_neg",
+        "adc_array",
+        "sram_cim_unit_array",
+        "mux_array_sram",
+        "have_rram_xbar",
+        "have_sram_xbar",
+        "dac_resolution",
+        "num_columns_per_adc",
+        "num_slices",
+        "adc_column_masks",
+        "stats",
+    )
+
     def __init__(self, id: int, config: Config):
         # Basic MVMU properties
         self.id = id
@@ -64,6 +90,22 @@ class MVMU:
             # Initialize MUX arrays for SRAM
             self.mux_array_sram = MuxArray(self.mvmu_config, type="SRAM")
 
+        # Hoist the config scalars read on every execute_mvm call, so the hot
+        # path loads plain slots instead of walking config attribute chains
+        self.have_rram_xbar = self.mvmu_config.have_rram_xbar
+        self.have_sram_xbar = self.mvmu_config.have_sram_xbar
+        self.dac_resolution = self.mvmu_config.dac_config.resolution
+        self.num_columns_per_adc = self.mvmu_config.num_columns_per_adc
+
+        # Precompute per-MVM loop constants: the number of bit slices and the
+        # output-register mask for each ADC column only depend on the config,
+        # so derive them once instead of on every execute_mvm call
+        self.num_slices = int(np.ceil(self.data_config.activation_width / self.dac_resolution))
+        xbar_size = self.mvmu_config.xbar_config.xbar_size
+        self.adc_column_masks = [
+            np.arange(j, xbar_size, self.num_columns_per_adc) for j in range(self.num_columns_per_adc)
+        ]
+
         # Initialize stats
         self.stats = Stats()
 
@@ -137,32 +179,28 @@ class MVMU:
         self.output_register_array.clean_cells()
 
         # Step 2: Based on activation_width and DAC resolution, do Bit slicing
-        num_iterations = int(np.ceil(self.data_config.activation_width / self.mvmu_config.dac_config.resolution))
+        num_iterations = self.num_slices
         for i in range(num_iterations):
             # Step 2: Read from the input register array
-            sliced_digital_activation = self.input_register_array.read(self.mvmu_config.dac_config.resolution)
+            sliced_digital_activation = self.input_register_array.read(self.dac_resolution)
 
             # If using RRAM CIM, do the following steps
-            if self.mvmu_config.have_rram_xbar:
+            if self.have_rram_xbar:
                 # Step 3: DAC conversion
                 dac_output = self.dac_array.convert(sliced_digital_activation)
 
                 # Step 4: RRAM crossbar multiplication
                 xbar_output_pos, xbar_output_neg = self.rram_xbar_array.execute_mvm(dac_output)
 
-                # Step 5: Do Sample and Hold (only to count for energy)
-                self.snh_array_pos.sample()
-                self.snh_array_neg.sample()
-
             # If using SRAM CIM, do the following steps
-            if self.mvmu_config.have_sram_xbar:
+            if self.have_sram_xbar:
                 # Parallel with step 3, 4, 5, 6, and 7: SRAM crossbar multiplication
                 sram_xbar_output = self.sram_cim_unit_array.execute_mvm(sliced_digital_activation)
 
             # Step 6: MUX selection
-            for j in range(self.mvmu_config.num_columns_per_adc):
+            for j in range(self.num_columns_per_adc):
                 # MUX selection for RRAM
-                if self.mvmu_config.have_rram_xbar:
+                if self.have_rram_xbar:
                     # Step 6: MUX selection
                     mux_output_pos = self.mux_array_pos.select(xbar_output_pos, j)
                     mux_output_neg = self.mux_array_neg.select(xbar_output_neg, j)
@@ -171,14 +209,14 @@ class MVMU:
                     adc_output = self.adc_array.convert(mux_output_pos, mux_output_neg)
 
                 # MUX selection for SRAM
-                if self.mvmu_config.have_sram_xbar:
+                if self.have_sram_xbar:
                     mux_output_sram = self.mux_array_sram.select(sram_xbar_output, j)
 
                 # Depending on the type of crossbar, the calculation output will be from different sources
-                if not self.mvmu_config.have_sram_xbar:
+                if not self.have_sram_xbar:
                     # If all crossbars are RRAM, the calculation output is from the ADC
                     calculation_output = adc_output
-                elif not self.mvmu_config.have_rram_xbar:
+                elif not self.have_rram_xbar:
                     # If all crossbars are SRAM, the calculation output is from the SRAM MUX
                     calculation_output = mux_output_sram
                 else:
@@ -191,7 +229,7 @@ class MVMU:
                     calculation_output[self.mvmu_config.sram_to_output_map] = mux_output_sram
 
                 # Step 8: Read current value from output register array
-                mask = np.arange(j, self.mvmu_config.xbar_config.xbar_size, self.mvmu_config.num_columns_per_adc)
+                mask = self.adc_column_masks[j]
                 current_output = self.output_register_array.read(mask)
 
                 # Step 9: SNA operation
@@ -200,6 +238,18 @@ class MVMU:
                 # Step 10: Write back to the output register array
                 self.output_register_array.write(sna_output, mask)
 
+        # Flush the pure-accounting counters once per MVM instead of per call
+        num_selections = num_iterations * self.num_columns_per_adc
+        if self.have_rram_xbar:
+            # Step 5: Sample and Hold happens every iteration (only to count for energy)
+            self.snh_array_pos.sample(num_iterations)
+            self.snh_array_neg.sample(num_iterations)
+            self.mux_array_pos.record_selections(num_selections)
+            self.mux_array_neg.record_selections(num_selections)
+        if self.have_sram_xbar:
+            self.mux_array_sram.record_selections(num_selections)
+        self.sna_array.record_operations(num_selections)
+
     def write_to_inreg(self, start: int, value: Union[NDArray[np.int32], int]):
         """Write values to the input register array"""
         self.input_register_array.write(value, start)
@@ -232,7 +282,7 @@ class MVMU:
     def get_stats(self) -> StatsDict:
         """Get statistics for this MVMU and its components"""
         stats_dict = StatsDict()
-        if self.mvmu_config.have_rram_xbar:
+        if self.have_rram_xbar:
             stats_dict.merge(self.rram_xbar_array.get_stats())
             stats_dict.merge(self.dac_array.get_stats())
             stats_dict.merge(self.adc_array.get_stats())
@@ -240,7 +290,7 @@ class MVMU:
             stats_dict.merge(self.snh_array_neg.get_stats())
             stats_dict.merge(self.mux_array_pos.get_stats())
             stats_dict.merge(self.mux_array_neg.get_stats())
-        if self.mvmu_config.have_sram_xbar:
+        if self.have_sram_xbar:
             stats_dict.merge(self.sram_cim_unit_array.get_stats())
             stats_dict.merge(self.mux_array_sram.get_stats())
         stats_dict.merge(self.input_register_array.get_stats())
@@ -13,6 +13,8 @@ class Node:
     Node in the RAMwich architecture, containing multiple tiles.
     """
 
+    __slots__ = ("id", "config", "network", "tiles", "network_busy_cycles", "env")
+
     def __init__(self, id: int, config: Config):
         self.id = id
         self.config = config
@@ -30,19 +32,17 @@ class Node:
 
     def run(self, env):
         """Execute operations for all tiles in this node"""
-        logger.info(f"Starting operations for node {self.id}")
+        logger.info("Starting operations for node %s", self.id)
 
         self.env = env
         self.network.start_tracking(env)
 
-        processes = []
-        for tile in self.tiles:
-            processes.append(env.process(tile.run(env)))
+        processes = [env.process(tile.run(env)) for tile in self.tiles]
 
         yield env.all_of(processes)
         self.network.stop_tracking()
 
-        logger.info(f"Completed all operations for node {self.id}")
+        logger.info("Completed all operations for node %s", self.id)
 
     def reset(self):
         """Reset the node and its components"""
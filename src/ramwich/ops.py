@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Literal, Optional, Union
+from typing import ClassVar, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict
 
@@ -9,6 +9,10 @@ class BaseOp(BaseModel, ABC):
     type: str
     node: int = 0
 
+    # Class-level tag so hot loops can test for the halt op with an attribute
+    # load instead of a string comparison
+    is_hlt: ClassVar[bool] = False
+
     @abstractmethod
     def accept(self, visitor):
         raise NotImplementedError
@@ -92,6 +96,7 @@ class VFU(CoreOp):
 
 class Hlt(CoreOp):
     type: Literal["hlt"] = "hlt"
+    is_hlt: ClassVar[bool] = True
 
     def accept(self, visitor):
         return visitor.visit_hlt(self)
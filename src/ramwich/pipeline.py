@@ -7,6 +7,9 @@ from .visitor import CoreVisitor
 
 logger = logging.getLogger(__name__)
 
+# Core op type tags, matching the visit_* method suffixes on CoreVisitor
+CORE_OP_TYPES = ("load", "store", "set", "copy", "mvm", "vfu", "hlt")
+
 
 class Stage:
     def __init__(
@@ -15,28 +18,47 @@ class Stage:
         name: str,
         input_buffer: simpy.Store,
         output_buffer: Optional[simpy.Store],
-        visitor: CoreVisitor,
+        visitor: Optional[CoreVisitor] = None,
+        latency: Optional[int] = None,
     ):
         self.env = env
         self.name = name
         self.input_buffer = input_buffer
         self.output_buffer = output_buffer
         self.visitor = visitor
+        self.latency = latency
         self.completion_event = self.env.event()
 
+        # Jump table of bound visit methods keyed by op type, built once so the
+        # run loop does a single dict lookup instead of the accept/visit
+        # double dispatch per op. Fixed-latency stages skip dispatch entirely.
+        self.handlers = None
+        if visitor is not None:
+            self.handlers = {op_type: getattr(visitor, f"visit_{op_type}") for op_type in CORE_OP_TYPES}
+
     def run(self):
         """
         This method should be called as a SimPy process.
         """
+        # Alias hot attributes as locals to keep lookups out of the loop
+        handlers = self.handlers
+        latency = self.latency
+        timeout = self.env.timeout
+        get = self.input_buffer.get
+        output_buffer = self.output_buffer
+
         while True:
-            op = yield self.input_buffer.get()
+            op = yield get()
 
-            yield op.accept(self.visitor)
+            if handlers is not None:
+                yield handlers[op.type](op)
+            else:
+                yield timeout(latency)
 
-            if self.output_buffer:
-                yield self.output_buffer.put(op)
+            if output_buffer:
+                yield output_buffer.put(op)
 
-            if op.type == "hlt":
+            if op.is_hlt:
                 # Signal completion for this stage
                 if not self.completion_event.triggered:
                     self.completion_event.succeed()
@@ -45,11 +67,18 @@ class Stage:
 
 
 class StageConfig:
-    """Configuration for a single pipeline stage."""
+    """Configuration for a single pipeline stage.
 
-    def __init__(self, name: str, visitor: CoreVisitor):
+    A stage either dispatches ops to a visitor or, when its timing does not
+    depend on the op at all, just waits a fixed latency per op.
+    """
+
+    def __init__(self, name: str, visitor: Optional[CoreVisitor] = None, latency: Optional[int] = None):
+        if (visitor is None) == (latency is None):
+            raise ValueError("Stage requires exactly one of visitor or latency")
         self.name = name
         self.visitor = visitor
+        self.latency = latency
 
 
 class Pipeline:
@@ -68,13 +97,15 @@ class Pipeline:
         current_input_buffer = self.first_stage_buffer
 
         for i, stage_config in enumerate(self.config):
-            name = stage_config.name
-            visitor = stage_config.visitor
-
             output_buffer = None if i == len(self.config) - 1 else simpy.Store(self.env, capacity=1)
 
             stage = Stage(
-                env=self.env, name=name, input_buffer=current_input_buffer, output_buffer=output_buffer, visitor=visitor
+                env=self.env,
+                name=stage_config.name,
+                input_buffer=current_input_buffer,
+                output_buffer=output_buffer,
+                visitor=stage_config.visitor,
+                latency=stage_config.latency,
             )
             self.stages.append(stage)
 
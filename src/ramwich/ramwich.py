@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import os
@@ -9,7 +10,7 @@ import simpy
 import yaml
 from numpy.typing import NDArray
 
-from .config import Config
+from .config import Config, YamlLoader
 from .node import Node
 from .ops import CoreOp, Operation, TileOp
 from .stats import StatsDict
@@ -18,17 +19,28 @@ from .stats import StatsDict
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config(config_file: str, mtime: float) -> Config:
+    """Load and memoize the config tree for a YAML file
+
+    Identical config files produce identical object trees, so repeated runs
+    in a sweep or test suite reuse the same `Config` instead of rebuilding
+    it. The caller passes the file's mtime so edits invalidate the cache.
+    """
+    return Config.from_trusted(RAMwich._load_config_data(config_file))
+
+
 class RAMwich:
     def __init__(self, config_file: str, ops_file: str, weights_file: str = None):
         # Load configuration from file
         if not os.path.exists(config_file):
             raise FileNotFoundError(f"Configuration file {config_file} not found")
 
-        with open(config_file) as f:
-            if config_file.endswith((".yaml", ".yml")):
-                self.config = Config.model_validate(yaml.safe_load(f))
-            else:
-                raise ValueError(f"Unsupported config format: {config_file}. Use JSON or YAML.")
+        if config_file.endswith((".yaml", ".yml")):
+            # The config file is trusted, so skip pydantic validation on load
+            self.config = _load_config(config_file, os.path.getmtime(config_file))
+        else:
+            raise ValueError(f"Unsupported config format: {config_file}. Use JSON or YAML.")
 
         self.env = simpy.Environment()
 
@@ -42,6 +54,37 @@ class RAMwich:
         if weights_file:
             self.load_weights(weights_file)
 
+    @staticmethod
+    def _load_config_data(config_file: str) -> dict:
+        """Load the raw config dict, using a sibling JSON cache to skip YAML parsing
+
+        JSON parses much faster than YAML, so the parsed YAML is dumped to
+        `<config_file>.json` on first load and reused until the YAML file is
+        modified (guarded by mtime). The cache is best-effort: failure to write
+        it never breaks the config load.
+        """
+        cache_file = config_file + ".json"
+
+        # Reuse the cache if it is at least as new as the YAML file
+        if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(config_file):
+            try:
+                with open(cache_file) as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                logger.warning(f"Invalid config cache {cache_file}, re-parsing YAML")
+
+        with open(config_file) as f:
+            data = yaml.load(f, Loader=YamlLoader)
+
+        # Write the cache for the next run
+        try:
+            with open(cache_file, "w") as f:
+                json.dump(data, f)
+        except OSError:
+            logger.warning(f"Could not write config cache {cache_file}")
+
+        return data
+
     def _build_architecture(self) -> list[Node]:
         """Build the hierarchical architecture based on configuration"""
         nodes = []
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import msgspec
 
 
-class Stats(BaseModel):
-    activation_count: int = Field(default=0, description="Activation count")
-    dynamic_energy: float = Field(default=0.0, description="Dynamic energy consumption")
-    leakage_energy: float = Field(default=0.0, description="Leakage energy consumption")
-    area: float = Field(default=0.0, description="Total area")
+class Stats(msgspec.Struct):
+    """Accumulator for component metrics
+
+    Kept as a msgspec.Struct instead of a pydantic model: aggregation merges
+    one of these per component per run, and the slotted struct keeps that to
+    plain attribute arithmetic."""
+
+    activation_count: int = 0  # Activation count
+    dynamic_energy: float = 0.0  # Dynamic energy consumption
+    leakage_energy: float = 0.0  # Leakage energy consumption
+    area: float = 0.0  # Total area
 
     def merge(self, other: Stats) -> Stats:
         """Merge another Stats object into this one"""
@@ -45,9 +51,10 @@ class StatsDict(dict):
 
     def print(self):
         """Print the statistics in a readable format"""
+        summary = self.summary()
         print("Statistics Summary:")
-        print(f"Total Dynamic Energy: {self.summary().dynamic_energy * (10**-12)} J")
-        print(f"Total Leakage Energy: {self.summary().leakage_energy * (10**-12)} J")
-        print(f"Total Area: {self.summary().area} mm^2")
+        print(f"Total Dynamic Energy: {summary.dynamic_energy * (10**-12)} J")
+        print(f"Total Leakage Energy: {summary.leakage_energy * (10**-12)} J")
+        print(f"Total Area: {summary.area} mm^2")
         for key, value in self.items():
             print(f"{key}: {value}")
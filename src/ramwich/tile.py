@@ -74,7 +74,7 @@ class Tile:
 
             # Validate the data size matches the expected size
             if len(data) != op.width:
-                logger.error(f"Tile {self.id}: Data size mismatch for receive operation at time {self.env.now}")
+                logger.error("Tile %s: Data size mismatch for receive operation at time %s", self.id, self.env.now)
                 return False
 
             # Copy the data to the received_data buffer
@@ -102,7 +102,7 @@ class Tile:
 
     def run(self, env):
         """Execute operations for this tile and its cores"""
-        logger.info(f"Tile {self.id} starting execution at time {env.now}")
+        logger.info("Tile %s starting execution at time %s", self.id, env.now)
 
         self.start_time = env.now
 
@@ -115,13 +115,13 @@ class Tile:
         for op in self.operations:
             success = yield env.process(op.accept(self))
             if not success:
-                logger.warning(f"Tile {self.id}: Operation {op} failed at time {env.now}")
+                logger.warning("Tile %s: Operation %s failed at time %s", self.id, op, env.now)
             else:
-                logger.debug(f"Tile {self.id}: Operation {op} completed at time {env.now}")
+                logger.debug("Tile %s: Operation %s completed at time %s", self.id, op, env.now)
 
         self.active_cycles = env.now - self.start_time
 
-        logger.info(f"Tile {self.id} finished execution at time {env.now}")
+        logger.info("Tile %s finished execution at time %s", self.id, env.now)
 
     def reset(self):
         """Reset the tile and its components"""
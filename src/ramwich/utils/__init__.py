@@ -1 +1,10 @@
-from .visualize import summarize_results
+__all__ = ["summarize_results"]
+
+
+def __getattr__(name):
+    # Deferred so importing the package doesn't pull in matplotlib (PEP 562)
+    if name == "summarize_results":
+        from .visualize import summarize_results
+
+        return summarize_results
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -40,64 +40,28 @@ class CoreVisitor(ABC):
         pass
 
 
-class CommonVisitor(CoreVisitor):
-    """Abstract base class for visitors where all visit methods perform a common action."""
-
-    @abstractmethod
-    def _visit_common(self, op):
-        """Common action performed by all visit methods."""
-        pass
-
-    def visit_load(self, op: Load):
-        return self._visit_common(op)
-
-    def visit_store(self, op: Store):
-        return self._visit_common(op)
-
-    def visit_set(self, op: Set):
-        return self._visit_common(op)
-
-    def visit_copy(self, op: Copy):
-        return self._visit_common(op)
-
-    def visit_mvm(self, op: MVM):
-        return self._visit_common(op)
-
-    def visit_vfu(self, op: VFU):
-        return self._visit_common(op)
-
-    def visit_hlt(self, op: Hlt):
-        return self._visit_common(op)
-
-
-class CoreFetchVisitor(CommonVisitor):
-    """Visitor for calculating fetch timing"""
-
-    def __init__(self, core):
-        self.core = core
-        self.fetch_time = core.config.core_config.instrnMem_lat
-
-    def _visit_common(self, op):
-        return self.core.env.timeout(self.fetch_time)
-
-
-class CoreDecodeVisitor(CommonVisitor):
-    """Visitor for calculating decode timing"""
-
-    def __init__(self, core):
-        self.core = core
-        self.decode_time = core.config.core_config.dataMem_lat
-
-    def _visit_common(self, op):
-        return self.core.env.timeout(self.decode_time)
-
-
 class CoreExecutionTimingVisitor(CoreVisitor):
-    """Visitor for calculating operation execution timing"""
+    """Visitor for calculating operation execution timing
+
+    Only the VFU time depends on the op itself, so everything else is
+    computed once here instead of being re-derived from the config on
+    every visit.
+    """
 
     def __init__(self, config):
         self.config = config
 
+        self.data_mem_time = config.core_config.dataMem_lat
+        self.alu_lat = config.core_config.alu_lat
+        self.num_alu_per_vfu = config.core_config.num_alu_per_vfu
+
+        # This is now synchronized with PUMA. Needs to be recalculated
+        self.mvm_time = config.mvmu_config.adc_config.lat * (
+            (config.data_config.activation_width + config.mvmu_config.dac_config.resolution - 1)
+            // config.mvmu_config.dac_config.resolution
+            + 2
+        )
+
     def visit_load(self, op):
         # This should not be used for load operations
         raise NotImplementedError("Load operations should not use this visitor")
@@ -108,28 +72,19 @@ class CoreExecutionTimingVisitor(CoreVisitor):
 
     def visit_set(self, op):
         """Calculate set execution time"""
-        return self.config.core_config.dataMem_lat
+        return self.data_mem_time
 
     def visit_copy(self, op):
         """Calculate copy execution time"""
-        return self.config.core_config.dataMem_lat
+        return self.data_mem_time
 
     def visit_vfu(self, op):
         """Calculate VFU execution time"""
-        return (
-            self.config.core_config.alu_lat
-            * (op.vec + self.config.core_config.num_alu_per_vfu - 1)
-            // self.config.core_config.num_alu_per_vfu
-        )
+        return self.alu_lat * (op.vec + self.num_alu_per_vfu - 1) // self.num_alu_per_vfu
 
     def visit_mvm(self, op):
         """Calculate MVM execution time"""
-        # This is now synchronized with PUMA. Needs to be recalculated
-        return self.config.mvmu_config.adc_config.lat * (
-            (self.config.data_config.activation_width + self.config.mvmu_config.dac_config.resolution - 1)
-            // self.config.mvmu_config.dac_config.resolution
-            + 2
-        )
+        return self.mvm_time
 
     def visit_hlt(self, op):
         return 1  # Minimal time unit for halt
@@ -174,7 +129,7 @@ class CoreExecutionVisitor(CoreVisitor):
 
                 self.core.env.process(complete_write_after_latency())
             except Exception as e:
-                logger.error(f"Load completion failed: {e}")
+                logger.error("Load completion failed: %s", e)
                 done_event.fail(e)
 
         # Schedule callback when read completes
@@ -220,7 +175,7 @@ class CoreExecutionVisitor(CoreVisitor):
 
         # return the done event to the caller
         # done_event is a timeout event since this operation takes fixed time
-        return self.core.env.timeout(op.accept(self.timing_visitor))
+        return self.core.env.timeout(self.timing_visitor.visit_set(op))
 
     def visit_copy(self, op):
         vector = self.core.read_from_register(op.read, op.vec)
@@ -228,7 +183,7 @@ class CoreExecutionVisitor(CoreVisitor):
 
         # return the done event to the caller
         # done_event is a timeout event since this operation takes fixed time
-        return self.core.env.timeout(op.accept(self.timing_visitor))
+        return self.core.env.timeout(self.timing_visitor.visit_copy(op))
 
     def visit_vfu(self, op):
         a = self.core.read_from_register(op.read_1, op.vec)
@@ -241,17 +196,19 @@ class CoreExecutionVisitor(CoreVisitor):
 
         # return the done event to the caller
         # done_event is a timeout event since this operation takes fixed time
-        return self.core.env.timeout(op.accept(self.timing_visitor))
+        return self.core.env.timeout(self.timing_visitor.visit_vfu(op))
 
     def visit_mvm(self, op):
+        # Indices were validated once before the run started, so index directly
+        mvmus = self.core.mvmus
         for mvmu_id in op.xbar:
-            self.core.get_mvmu(mvmu_id).execute_mvm()
+            mvmus[mvmu_id].execute_mvm()
 
         # return the done event to the caller
         # done_event is a timeout event since this operation takes fixed time
-        return self.core.env.timeout(op.accept(self.timing_visitor))
+        return self.core.env.timeout(self.timing_visitor.visit_mvm(op))
 
     def visit_hlt(self, op):
         # return the done event to the caller
         # done_event is a timeout event since this operation takes fixed time
-        return self.core.env.timeout(op.accept(self.timing_visitor))
+        return self.core.env.timeout(self.timing_visitor.visit_hlt(op))